@@ -0,0 +1,81 @@
+"""
+One-shot export of the Serie A SQLite tables to Parquet.
+
+Run this after refreshing data/serie_a.db so the dashboard can read
+columnar files instead of going through the SQLite driver:
+
+    python scripts/build_parquet.py
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    # Optional Arrow-native reader: streams columnar buffers straight
+    # into pandas instead of boxing every value as a Python object.
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = PROJECT_ROOT / "data"
+DB_PATH = DATA_DIR / "serie_a.db"
+
+# matches is deliberately not exported: the dashboard never reads it.
+TABLES = ["standings", "player_goals"]
+
+
+def read_table(conn, table):
+    """Read one full SQLite table, via connectorx when available."""
+    if cx is not None:
+        return cx.read_sql(f"sqlite://{DB_PATH}", f"SELECT * FROM {table}",
+                           return_type="pandas")
+    return pd.read_sql(f"SELECT * FROM {table}", conn)
+
+
+def export_table(conn, table):
+    """Dump one SQLite table to data/<table>.parquet (zstd-compressed)."""
+    df = read_table(conn, table)
+    out_path = DATA_DIR / f"{table}.parquet"
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False),
+                   out_path, compression="zstd")
+    print(f"✅ {table}: {len(df)} rows -> {out_path.name}")
+
+
+# Read-optimizing settings: mmap the file instead of read() syscalls,
+# keep a 64 MB page cache, and stage temp data in memory.
+READ_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def open_db():
+    """Open the SQLite file with read-tuned PRAGMAs applied."""
+    conn = sqlite3.connect(DB_PATH)
+    for pragma in READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def main():
+    if not DB_PATH.exists():
+        raise SystemExit(f"❌ Database not found at {DB_PATH}")
+    conn = open_db()
+    try:
+        for table in TABLES:
+            export_table(conn, table)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
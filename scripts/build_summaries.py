@@ -0,0 +1,37 @@
+"""
+Precompute the small per-player aggregates the Inter stats tabs render.
+
+The dashboard refreshes these automatically when the goals export is
+newer, so this script is only needed to rebuild them out-of-band:
+
+    python scripts/build_summaries.py
+"""
+
+import sys
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from serie_a.data import PLAYER_GOALS_COLS, summarize_player_goals  # noqa: E402
+
+DATA_DIR = PROJECT_ROOT / "data"
+
+
+def main():
+    goals_path = DATA_DIR / "player_goals.parquet"
+    if not goals_path.exists():
+        raise SystemExit("❌ player_goals.parquet not found — run scripts/build_parquet.py first.")
+
+    goals = pq.read_table(goals_path, columns=PLAYER_GOALS_COLS).to_pandas()
+    summary = summarize_player_goals(goals)
+
+    out_path = DATA_DIR / "player_goals_summary.parquet"
+    summary.to_parquet(out_path, compression="zstd")
+    print(f"✅ {len(summary)} summary rows -> {out_path.name}")
+
+
+if __name__ == "__main__":
+    main()
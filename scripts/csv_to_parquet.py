@@ -0,0 +1,32 @@
+"""
+Migrate a legacy scrape CSV (e.g. data/lautaro_martinez_goals.csv) to Parquet:
+
+    python scripts/csv_to_parquet.py data/lautaro_martinez_goals.csv
+
+The dashboard itself only reads the Parquet exports; this is a one-shot
+helper for CSVs produced by older scrape runs.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+
+def main():
+    if len(sys.argv) != 2:
+        raise SystemExit(f"Usage: python {sys.argv[0]} <csv_path>")
+    csv_path = Path(sys.argv[1])
+    if not csv_path.exists():
+        raise SystemExit(f"❌ {csv_path} not found")
+
+    # The pyarrow engine parses and types the CSV columnar-side,
+    # several times faster than the default C engine.
+    df = pd.read_csv(csv_path, engine="pyarrow", dtype_backend="pyarrow")
+    out_path = csv_path.with_suffix(".parquet")
+    df.to_parquet(out_path, compression="zstd")
+    print(f"✅ {len(df)} rows -> {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Shared modules for the Serie A dashboard."""
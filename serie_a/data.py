@@ -0,0 +1,525 @@
+"""
+Data access for the Serie A dashboard.
+
+All tables are read from the Parquet exports in data/ (built by the
+scripts in scripts/); DuckDB handles the standings analytics queries.
+"""
+
+import sqlite3
+
+import duckdb
+import streamlit as st
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from pathlib import Path
+
+# Copy-on-write keeps filtered slices as lazy views until something
+# writes to them, so the pipelines below never need defensive .copy().
+pd.set_option("mode.copy_on_write", True)
+
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+DB_PATH = DATA_DIR / "serie_a.db"
+
+# Tables exported 1:1 from the SQLite file. The matches table stays in
+# SQLite only: no page reads it, so exporting it would be wasted I/O.
+DB_TABLES = ("standings", "player_goals")
+
+# Only the columns the standings page actually touches.
+STANDINGS_COLS = ["season", "matchday", "team", "points", "goal_diff", "position"]
+
+# Narrow dtypes for the standings slices: position/matchday fit in int8,
+# points/goal_diff in int16, and the string columns dictionary-encode as
+# category. The filter scans over these columns are memory-bound, so the
+# smaller rows pay off on every rerun.
+STANDINGS_DTYPES = {
+    "season": "category",
+    "matchday": "int8",
+    "team": "category",
+    "points": "int16",
+    "goal_diff": "int16",
+    "position": "int8",
+}
+
+# Only the columns the Inter stats page actually renders or derives from.
+PLAYER_GOALS_COLS = ["player_name", "season", "competition", "date", "venue",
+                     "opponent", "result", "minute", "at_score", "goal_assist"]
+
+# Low-cardinality string columns stored as categories so groupbys and
+# value_counts hash small integer codes instead of Python strings.
+PLAYER_GOALS_CATEGORICALS = ["player_name", "season", "competition", "goal_assist"]
+
+VENUE_DTYPE = pd.CategoricalDtype(["H", "A"])
+
+# Lautaro's first day at Inter — goals before this are pre-Inter.
+INTER_DEBUT = pd.Timestamp("2018-07-04")
+
+# Closed set of club competitions Inter plays in; matched exactly with
+# .isin on the categorical column, never with substring/regex scans.
+INTER_COMPETITIONS = [
+    "Serie A",
+    "Coppa Italia",
+    "Supercoppa Italiana",
+    "Champions League",
+    "Europa League",
+    "Club World Cup",
+]
+
+MINUTE_BINS = np.array([0, 15, 30, 45, 60, 75, 90, 120])
+MINUTE_LABELS = np.array(["0-15", "16-30", "31-45", "46-60", "61-75", "76-90", "90+"])
+
+
+# ===============================================================
+# Parquet / DuckDB plumbing
+# ===============================================================
+def _is_stale(path, source_mtime):
+    return not path.exists() or path.stat().st_mtime < source_mtime
+
+
+def _export_via_duckdb(name, path):
+    """Copy one SQLite table straight to Parquet inside DuckDB.
+
+    The sqlite scanner reads the table with DuckDB's vectorized engine
+    and the COPY writes Parquet directly, so no rows are ever boxed as
+    Python objects on the way through.
+    """
+    duck = get_duck()
+    duck.execute(f"ATTACH '{DB_PATH}' AS sa (TYPE SQLITE)")
+    try:
+        duck.execute(
+            f"COPY (SELECT * FROM sa.{name}) TO '{path}' "
+            "(FORMAT PARQUET, COMPRESSION ZSTD)"
+        )
+    finally:
+        duck.execute("DETACH sa")
+
+
+def _refresh_export(name, path):
+    """(Re)build one Parquet export that is missing or older than its source.
+
+    The SQLite file rarely changes, so on warm starts this is a pair of
+    stat() calls and the loaders never touch SQL again.
+    """
+    if name in DB_TABLES:
+        if not DB_PATH.exists() or not _is_stale(path, DB_PATH.stat().st_mtime):
+            return
+        try:
+            _export_via_duckdb(name, path)
+            return
+        except duckdb.Error:
+            # sqlite scanner unavailable (e.g. offline first run); fall
+            # back to the row-at-a-time reader.
+            pass
+        conn = sqlite3.connect(DB_PATH)
+        try:
+            df = pd.read_sql(f"SELECT * FROM {name}", conn)
+        finally:
+            conn.close()
+        df.to_parquet(path, compression="zstd")
+    elif name == "player_goals_summary":
+        goals_path = parquet_path("player_goals")
+        # The summary bakes in derived labels, so it is stale when either
+        # the goals data or this module (the summarization code) is newer
+        # — otherwise classifier fixes would never reach the on-disk file.
+        source_mtime = max(goals_path.stat().st_mtime,
+                           Path(__file__).stat().st_mtime)
+        if not _is_stale(path, source_mtime):
+            return
+        goals = pq.read_table(goals_path, columns=PLAYER_GOALS_COLS).to_pandas()
+        summarize_player_goals(goals).to_parquet(path, compression="zstd")
+
+
+def parquet_path(name):
+    """Return the path of one exported table, refreshing it if stale."""
+    path = DATA_DIR / f"{name}.parquet"
+    _refresh_export(name, path)
+    if not path.exists():
+        st.error(f"❌ {path.name} not found and {DB_PATH.name} is missing.")
+        st.stop()
+    return path
+
+
+def read_parquet_table(name, columns=None, filters=None):
+    """Read one exported table into pandas."""
+    return pq.read_table(parquet_path(name), columns=columns, filters=filters).to_pandas()
+
+
+@st.cache_resource
+def get_duck():
+    """Return a shared DuckDB connection for the analytics queries.
+
+    DuckDB scans the Parquet files with a vectorized engine, so the
+    standings slices and aggregates never pass through pandas filtering.
+    """
+    return duckdb.connect()
+
+
+def duck_query(sql, params):
+    """Run one parameterized DuckDB query and return a DataFrame."""
+    return get_duck().execute(sql, params).df()
+
+
+# Last SQLite mtime the caches were built against. Module-global (not
+# session state) because Streamlit caches are shared across sessions.
+_seen_db_mtime = None
+
+
+def refresh_caches():
+    """Drop every cache when the SQLite file changes; otherwise no-op.
+
+    The loaders cache with ttl=None, so invalidation is driven purely by
+    the data actually changing — a stat() call per rerun instead of a
+    blanket re-read every hour.
+    """
+    global _seen_db_mtime
+    mtime = DB_PATH.stat().st_mtime if DB_PATH.exists() else 0.0
+    if _seen_db_mtime is None:
+        _seen_db_mtime = mtime
+    elif mtime != _seen_db_mtime:
+        _seen_db_mtime = mtime
+        st.cache_data.clear()
+        st.cache_resource.clear()
+
+
+# ===============================================================
+# Standings loaders
+# ===============================================================
+@st.cache_data(ttl=None)
+def get_available_seasons():
+    """Return the sorted list of seasons present in the standings."""
+    df = duck_query(
+        "SELECT DISTINCT season FROM read_parquet(?) ORDER BY season",
+        [str(parquet_path("standings"))],
+    )
+    return df["season"].tolist()
+
+
+@st.cache_data(ttl=None)
+def get_max_matchday():
+    """Return the highest matchday present in the standings."""
+    df = duck_query(
+        "SELECT MAX(matchday) AS max_md FROM read_parquet(?)",
+        [str(parquet_path("standings"))],
+    )
+    return int(df["max_md"].iloc[0])
+
+
+@st.cache_resource(ttl=None)
+def load_standings_slice(matchday, seasons):
+    """Return standings rows for one matchday across the selected seasons.
+
+    The predicates run inside DuckDB's vectorized scan so only the
+    visible rows are materialized. `seasons` must be a tuple so the
+    cache key is hashable.
+    """
+    placeholders = ", ".join("?" * len(seasons))
+    sql = (
+        f"SELECT {', '.join(STANDINGS_COLS)} FROM read_parquet(?) "
+        f"WHERE matchday = ? AND season IN ({placeholders}) "
+        "ORDER BY position"
+    )
+    df = duck_query(sql, [str(parquet_path("standings")), matchday, *seasons])
+    return df.astype(STANDINGS_DTYPES)
+
+
+@st.cache_resource(ttl=None)
+def load_team_trajectory(team, seasons):
+    """Return one team's standings rows across the selected seasons."""
+    placeholders = ", ".join("?" * len(seasons))
+    sql = (
+        f"SELECT {', '.join(STANDINGS_COLS)} FROM read_parquet(?) "
+        f"WHERE team = ? AND season IN ({placeholders})"
+    )
+    df = duck_query(sql, [str(parquet_path("standings")), team, *seasons])
+    return df.astype(STANDINGS_DTYPES)
+
+
+@st.cache_resource(ttl=None)
+def standings_rollup():
+    """Return leader/top-4/max points per (season, matchday), indexed.
+
+    One GROUP BY over the whole table materializes the roll-up once;
+    every summary after that is a b-search slice of ~600 rows instead
+    of an aggregation over the standings.
+    """
+    sql = (
+        "SELECT season, matchday, "
+        "max(CASE WHEN position = 1 THEN points END) AS leader_pts, "
+        "avg(CASE WHEN position <= 4 THEN points END) AS top4_pts, "
+        "max(points) AS max_pts "
+        "FROM read_parquet(?) GROUP BY season, matchday"
+    )
+    df = duck_query(sql, [str(parquet_path("standings"))])
+    return df.set_index(["season", "matchday"]).sort_index()
+
+
+@st.cache_data(ttl=None)
+def summary_stats(matchday, seasons):
+    """Return the standings summary metrics for one (matchday, seasons) key.
+
+    Cached as a small dict so a rerun costs a lookup; a miss reads a few
+    rows of the precomputed roll-up instead of re-aggregating the slice.
+    Every season has exactly one leader and four top-4 rows, so the mean
+    of the per-season roll-up values equals the mean over the raw rows.
+    """
+    sub = standings_rollup().loc[(list(seasons), matchday), :]
+    return {
+        "avg_leader_pts": float(sub["leader_pts"].mean()),
+        "avg_top4_pts": float(sub["top4_pts"].mean()),
+        "max_pts": int(sub["max_pts"].max()),
+        "total_teams": int(load_standings_slice(matchday, seasons)["team"].nunique()),
+    }
+
+
+@st.cache_data(ttl=None)
+def player_overview(player_name):
+    """Return the header metrics for one player as a small dict.
+
+    Cached so the four metrics cost a dict lookup per rerun instead of
+    one full-column scan each.
+    """
+    player_data = enrich_player_data(player_name)
+    return {
+        "goals": len(player_data),
+        "seasons": int(player_data["season"].nunique()),
+        "competitions": int(player_data["competition"].nunique()),
+        "assisted": int(player_data["goal_assist"].notna().sum()),
+    }
+
+
+@st.cache_resource(ttl=None)
+def trajectory_matrix(team, seasons):
+    """Return one team's positions as a matchday × season wide frame.
+
+    One pivot turns the long rows into a structure-of-arrays layout:
+    each selected season is a contiguous position column over a shared
+    matchday index, so a trace is two ndarray slices with no per-season
+    filtering.
+    """
+    df = load_team_trajectory(team, seasons)
+    return df.pivot(index="matchday", columns="season", values="position")
+
+
+@st.cache_resource(ttl=None)
+def load_points_quantiles(matchday, seasons):
+    """Return the five-number points summary per season at one matchday.
+
+    A box plot only needs these five numbers per season, so they are
+    computed inside DuckDB instead of shipping every team-row to Plotly.
+    """
+    placeholders = ", ".join("?" * len(seasons))
+    sql = (
+        "SELECT season, quantile_cont(points, [0.0, 0.25, 0.5, 0.75, 1.0]) AS q "
+        "FROM read_parquet(?) "
+        f"WHERE matchday = ? AND season IN ({placeholders}) "
+        "GROUP BY season ORDER BY season"
+    )
+    return duck_query(sql, [str(parquet_path("standings")), matchday, *seasons])
+
+
+@st.cache_resource(ttl=None)
+def load_race_data(season, top_n, matchday):
+    """Return (top-N teams at a matchday, their matchday × team points matrix).
+
+    The pivot gives the race data the same structure-of-arrays layout as
+    the trajectory matrix: one contiguous int16 points column per team
+    over a shared matchday index, so tracing a team is a column slice
+    with no per-team filtering or sorting.
+    """
+    at_md = load_standings_slice(matchday, (season,))
+    top_teams = at_md.head(top_n)["team"].tolist()
+    if not top_teams:
+        # No rows at this matchday (e.g. a season still in progress);
+        # an empty IN () list would not even parse in DuckDB.
+        return top_teams, pd.DataFrame()
+
+    placeholders = ", ".join("?" * len(top_teams))
+    sql = (
+        "SELECT team, matchday, points FROM read_parquet(?) "
+        f"WHERE season = ? AND team IN ({placeholders}) "
+        "ORDER BY team, matchday"
+    )
+    race_data = duck_query(sql, [str(parquet_path("standings")), season, *top_teams])
+    race_wide = (
+        race_data.astype({"points": "int16"})
+        .pivot(index="matchday", columns="team", values="points")
+    )
+    return top_teams, race_wide
+
+
+# ===============================================================
+# Player goals loaders and enrichment
+# ===============================================================
+@st.cache_resource(ttl=None)
+def load_player_goals(player_name=None):
+    """Return the player goals table with categorical string columns.
+
+    When a player is given, the filter is pushed into the Parquet read
+    together with the column projection, so only that player's rows and
+    the columns the page renders are materialized.
+    """
+    filters = [("player_name", "=", player_name)] if player_name else None
+    df = read_parquet_table("player_goals", columns=PLAYER_GOALS_COLS, filters=filters)
+    # Unassisted goals are stored as "" rather than NULL; normalize to
+    # NA so notna()/value_counts treat them as missing everywhere.
+    df["goal_assist"] = df["goal_assist"].replace("", pd.NA)
+    df = df.astype({c: "category" for c in PLAYER_GOALS_CATEGORICALS})
+    df["venue"] = df["venue"].astype(VENUE_DTYPE)
+    return df
+
+
+@st.cache_resource(ttl=None)
+def load_summary(player_name, metric):
+    """Return one precomputed {key, value} aggregate for a player.
+
+    The aggregates are materialized by scripts/build_summaries.py, so
+    the tabs just slice the summary file instead of re-running groupbys.
+    """
+    filters = [("player_name", "=", player_name), ("metric", "=", metric)]
+    return read_parquet_table("player_goals_summary",
+                              columns=["key", "value"], filters=filters)
+
+
+def classify_goal_context(player_data):
+    """Return a goal-context label per goal, computed with numpy masks.
+
+    The at-score/result columns hold "home:away" strings, so the venue
+    decides which side is the player's team; two splits and a np.where
+    swap feed np.select with no Python-level row loop.
+    """
+    # reindex pins the two split columns in place: on an empty or
+    # all-NaN series, expand=True would not produce them at all.
+    ts = player_data["at_score"].str.split(":", expand=True).reindex(columns=[0, 1])
+    th = pd.to_numeric(ts[0], errors="coerce").to_numpy()
+    ta = pd.to_numeric(ts[1], errors="coerce").to_numpy()
+    fs = player_data["result"].str.split(":", expand=True).reindex(columns=[0, 1])
+    fh = pd.to_numeric(fs[0], errors="coerce").to_numpy()
+    fa = pd.to_numeric(fs[1], errors="coerce").to_numpy()
+
+    away = (player_data["venue"] == "A").to_numpy()
+    tg = np.where(away, ta, th)
+    og = np.where(away, th, ta)
+    ftg = np.where(away, fa, fh)
+    fog = np.where(away, fh, fa)
+
+    conds = [
+        np.isnan(tg) | np.isnan(og),
+        (tg == 1) & (og == 0),
+        tg == og,
+        (tg > og) & (ftg < fog),
+        tg > og,
+    ]
+    choices = [
+        "Unknown",
+        "Opening Goal",
+        "Equalizer",
+        "Consolation Goal",
+        "Goal While Leading",
+    ]
+    return np.select(conds, choices, default="Trailing Goal")
+
+
+def parse_minutes(minute_col):
+    """Return (numeric minute, minute-range label) from raw "45+2'" strings.
+
+    A single regex extract replaces the str.replace chain, and
+    np.digitize bins the result in one pass.
+    """
+    mn = pd.to_numeric(
+        minute_col.str.extract(r"^(\d+)", expand=False), errors="coerce"
+    ).astype("Int16")
+    # right=True makes the bins right-closed like the labels, so minute
+    # 15 lands in "0-15" and 45 (incl. "45+X'" stoppage) in "31-45".
+    idx = np.clip(
+        np.digitize(mn.to_numpy(na_value=-1), MINUTE_BINS, right=True) - 1,
+        0, len(MINUTE_LABELS) - 1,
+    )
+    minute_range = np.where(mn.isna(), None, MINUTE_LABELS[idx])
+    return mn, minute_range
+
+
+def bin_minute_counts(minutes):
+    """Return goals-per-minute-range counts for an int array of minutes.
+
+    searchsorted + bincount over the fixed bin edges: branchless, no
+    Categorical objects and no sort, unlike pd.cut + value_counts.
+    """
+    # side="left" keeps the bins right-closed like the labels, matching
+    # parse_minutes' np.digitize(..., right=True).
+    idx = np.clip(
+        np.searchsorted(MINUTE_BINS, minutes, side="left") - 1,
+        0, len(MINUTE_LABELS) - 1,
+    )
+    return np.bincount(idx, minlength=len(MINUTE_LABELS))
+
+
+# metric name -> column holding the aggregation key (minute_range is
+# handled separately via bin_minute_counts)
+SUMMARY_METRICS = {
+    "by_season": "season",
+    "venue": "venue",
+    "context": "goal_context",
+}
+
+
+def _summarize_player(player_data):
+    """Return {metric, key, value} count rows for one player's goals."""
+    # Same filter as enrich_player_data, so the precomputed charts count
+    # exactly the rows the page's header metrics count.
+    dates = pd.to_datetime(player_data["date"], errors="coerce", cache=True)
+    keep = (dates >= INTER_DEBUT) & player_data["competition"].isin(INTER_COMPETITIONS)
+    player_data = player_data[keep]
+    player_data = player_data.assign(goal_context=classify_goal_context(player_data))
+
+    parts = []
+    for metric, col in SUMMARY_METRICS.items():
+        counts = player_data[col].value_counts().rename_axis("key").reset_index(name="value")
+        counts.insert(0, "metric", metric)
+        parts.append(counts)
+
+    mn, _ = parse_minutes(player_data["minute"])
+    counts = bin_minute_counts(mn.dropna().to_numpy(dtype="int64"))
+    observed = counts > 0
+    parts.append(pd.DataFrame({
+        "metric": "minute_range",
+        "key": MINUTE_LABELS[observed],
+        "value": counts[observed],
+    }))
+    return pd.concat(parts, ignore_index=True)
+
+
+def summarize_player_goals(goals):
+    """Return the per-player tab aggregates for the whole goals table."""
+    return (
+        goals.groupby("player_name", group_keys=True)
+        .apply(_summarize_player)
+        .reset_index(level=0)
+        .reset_index(drop=True)
+    )
+
+
+@st.cache_resource(ttl=None)
+def enrich_player_data(player_name):
+    """Return one player's Inter-era goals with all derived columns.
+
+    Runs once per player and is cached, so widget interactions rerun
+    only the view code, not the filtering and context classification.
+    """
+    player_data = load_player_goals(player_name)
+    if player_data.empty:
+        return player_data
+    # Filter before assigning so the derived columns are only computed
+    # for the rows that survive; under copy-on-write the slice stays a
+    # lazy view of the shared cached frame until assign() materializes
+    # the (smaller) result.
+    dates = pd.to_datetime(player_data["date"], errors="coerce", cache=True)
+    keep = (dates >= INTER_DEBUT) & player_data["competition"].isin(INTER_COMPETITIONS)
+    player_data = player_data[keep]
+    minute_clean, minute_range = parse_minutes(player_data["minute"])
+    return player_data.assign(
+        date=dates[keep],
+        goal_context=classify_goal_context(player_data),
+        minute_clean=minute_clean,
+        minute_range=minute_range,
+    )
@@ -0,0 +1,7 @@
+"""Streamlit views for the Serie A dashboard, one module per page."""
+
+from serie_a.views.inter import show_inter_stats_app
+from serie_a.views.landing import show_landing_page
+from serie_a.views.standings import show_standings_app
+
+__all__ = ["show_inter_stats_app", "show_landing_page", "show_standings_app"]
@@ -0,0 +1,139 @@
+"""
+Lautaro Martínez page: per-season, context, minute and match-log tabs.
+"""
+
+import streamlit as st
+
+from serie_a.data import (
+    MINUTE_LABELS,
+    enrich_player_data,
+    load_summary,
+    player_overview,
+)
+from serie_a.views.theme import BASE_LAYOUT
+
+
+# ===============================================================
+# Figure builders (memoized so reruns reuse assembled traces)
+# ===============================================================
+@st.cache_data(ttl=None)
+def build_season_goals_fig(player_name):
+    """Build the goals-per-season bar from the precomputed summary."""
+    import plotly.graph_objects as go
+
+    season_goals = load_summary(player_name, "by_season").sort_values("key")
+    # go.Bar with plain numpy arrays skips px's tidy-data inference.
+    fig = go.Figure(go.Bar(
+        x=season_goals["key"].to_numpy(),
+        y=season_goals["value"].to_numpy(),
+    ))
+    fig.update_layout(**BASE_LAYOUT, title="Goals per season",
+                      xaxis_title="season", yaxis_title="Goals")
+    return fig
+
+
+@st.cache_data(ttl=None)
+def build_context_fig(player_name):
+    """Build the goals-by-context bar from the precomputed summary."""
+    import plotly.graph_objects as go
+
+    ctx = load_summary(player_name, "context")
+    fig = go.Figure(go.Bar(x=ctx["key"].to_numpy(), y=ctx["value"].to_numpy()))
+    fig.update_layout(**BASE_LAYOUT, title="Goals by match context",
+                      xaxis_title="goal_context", yaxis_title="Goals")
+    return fig
+
+
+@st.cache_data(ttl=None)
+def build_minute_fig(player_name):
+    """Build the goals-by-minute bar from the precomputed summary."""
+    import plotly.graph_objects as go
+
+    minute_dist = (
+        load_summary(player_name, "minute_range")
+        .set_index("key")["value"]
+        .reindex(MINUTE_LABELS, fill_value=0)
+    )
+    fig = go.Figure(go.Bar(x=MINUTE_LABELS, y=minute_dist.to_numpy()))
+    fig.update_layout(**BASE_LAYOUT, title="Goals by match minute",
+                      xaxis_title="Minute Range", yaxis_title="Goals")
+    return fig
+
+
+@st.cache_data(ttl=None)
+def build_venue_fig(player_name):
+    """Build the home/away pie from the precomputed summary."""
+    import plotly.express as px
+
+    venue = load_summary(player_name, "venue").rename(
+        columns={"key": "Venue", "value": "Goals"}
+    )
+    venue["Venue"] = venue["Venue"].map({"H": "Home", "A": "Away"})
+    fig = px.pie(venue, names="Venue", values="Goals", title="Home vs away goals")
+    fig.update_layout(**BASE_LAYOUT)
+    return fig
+
+
+# ===============================================================
+# Page body
+# ===============================================================
+def show_inter_stats_app():
+    if st.button("← Back to Home"):
+        st.session_state.app_selection = None
+
+    st.title("⚫🔵 Inter Milan Player Statistics")
+    st.markdown("---")
+
+    player_data = enrich_player_data("Lautaro Martinez")
+    if player_data.empty:
+        st.warning("No goal data found for Lautaro Martínez in the database.")
+        return
+
+    overview = player_overview("Lautaro Martinez")
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Total Goals", overview["goals"])
+    c2.metric("Seasons", overview["seasons"])
+    c3.metric("Competitions", overview["competitions"])
+    c4.metric("Assisted Goals", overview["assisted"])
+
+    # st.tabs executes every tab body on each rerun even though only one
+    # is visible; a radio dispatch builds just the selected view.
+    view = st.radio(
+        "View",
+        ["📊 By Season", "🎯 Context & Assists", "⏱️ Minutes", "📋 Match Log"],
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+
+    if view == "📊 By Season":
+        st.plotly_chart(build_season_goals_fig("Lautaro Martinez"), use_container_width=True, theme=None)
+
+    elif view == "🎯 Context & Assists":
+        st.plotly_chart(build_context_fig("Lautaro Martinez"), use_container_width=True, theme=None)
+
+        # value_counts is a single Cython pass (and already sorted),
+        # unlike groupby().size() + sort_values. Empty strings mean
+        # "unassisted" in the raw data, so they are no provider either.
+        assists = player_data["goal_assist"]
+        assist_counts = assists[assists.notna() & assists.ne("")].value_counts()
+        assist_counts = assist_counts[assist_counts > 0].head(15)
+        st.markdown("**Top assist providers**")
+        st.dataframe(assist_counts.reset_index(name="Assists"), hide_index=True)
+
+    elif view == "⏱️ Minutes":
+        st.plotly_chart(build_minute_fig("Lautaro Martinez"), use_container_width=True, theme=None)
+        st.plotly_chart(build_venue_fig("Lautaro Martinez"), use_container_width=True, theme=None)
+
+    else:
+        # Copy-on-write is on, so the slice + assign below never needs a
+        # defensive .copy(); only the relabeled venue column is new.
+        recent_goals = player_data.sort_values("date", ascending=False).head(20)
+        display_cols = ["date", "season", "competition", "venue", "opponent",
+                        "result", "minute", "goal_context"]
+        display_df = recent_goals[display_cols].assign(
+            # O(#categories) relabel instead of an O(n) object-dtype map.
+            venue=recent_goals["venue"].cat.rename_categories(
+                {"H": "Home", "A": "Away"}
+            )
+        )
+        st.dataframe(display_df, hide_index=True)
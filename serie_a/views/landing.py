@@ -0,0 +1,35 @@
+"""
+Landing page with the two navigation cards.
+"""
+
+import streamlit as st
+
+# Static copy hoisted out of the function body so reruns reuse the same
+# str objects instead of rebuilding them on every script execution.
+_LANDING_TITLE = "⚽ Serie A Analytics Dashboard"
+_LANDING_INTRO = "Explore Inter Milan player performance, match data, and more."
+_CARD_STANDINGS_TITLE = "🏟️ Serie A Standings"
+_CARD_STANDINGS_TEXT = "Check the latest table and points by team."
+_CARD_INTER_TITLE = "⚫🔵 Inter Player Stats"
+_CARD_INTER_TEXT = "Compare Lautaro Martínez's goals, minutes, and match context."
+
+
+def show_landing_page():
+    st.title(_LANDING_TITLE)
+    st.markdown(_LANDING_INTRO)
+    st.markdown("---")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader(_CARD_STANDINGS_TITLE)
+        st.markdown(_CARD_STANDINGS_TEXT)
+        if st.button("View Standings"):
+            # Button clicks already trigger a rerun; setting state is enough.
+            st.session_state.app_selection = "standings"
+
+    with col2:
+        st.subheader(_CARD_INTER_TITLE)
+        st.markdown(_CARD_INTER_TEXT)
+        if st.button("View Lautaro Stats"):
+            st.session_state.app_selection = "inter_stats"
@@ -0,0 +1,253 @@
+"""
+Standings page: season comparison, team tracker, and points race.
+"""
+
+import json
+
+import pandas as pd
+import streamlit as st
+
+from serie_a.data import (
+    get_available_seasons,
+    get_max_matchday,
+    load_points_quantiles,
+    load_race_data,
+    load_standings_slice,
+    summary_stats,
+    trajectory_matrix,
+)
+from serie_a.views.theme import BASE_LAYOUT
+
+
+# ===============================================================
+# Figure builders (memoized so reruns reuse assembled traces)
+# ===============================================================
+@st.cache_data(ttl=None)
+def build_team_trajectory_fig(team, seasons):
+    """Build the per-season position trajectory figure for one team.
+
+    Deliberately not keyed on the matchday: the traces don't depend on
+    it, so the marker line is added at render time and slider ticks hit
+    this cache instead of rebuilding every trace.
+    """
+    import plotly.graph_objects as go
+
+    wide = trajectory_matrix(team, seasons)
+    fig = go.Figure()
+    for season in seasons:
+        if season not in wide.columns:
+            continue
+        positions = wide[season].dropna()
+        if positions.empty:
+            continue
+        # Scattergl renders on WebGL, keeping the chart cheap to paint
+        # as more seasons of history accumulate.
+        fig.add_trace(go.Scattergl(
+            x=positions.index.to_numpy(),
+            y=positions.to_numpy(),
+            mode="lines+markers",
+            name=season,
+        ))
+    fig.update_yaxes(autorange="reversed", title="Position")
+    fig.update_layout(
+        **BASE_LAYOUT,
+        title=f"{team}'s league position by matchday",
+        xaxis_title="Matchday",
+        hovermode="x unified",
+    )
+    return fig
+
+
+@st.cache_data(ttl=None)
+def build_points_box_json(matchday, seasons):
+    """Build the per-season points box plot as serialized figure JSON.
+
+    Feeding go.Box the five-number summary keeps the payload at five
+    floats per season instead of one row per team, and caching the
+    to_json output means reruns skip serialization entirely.
+    """
+    import plotly.graph_objects as go
+
+    quantiles = load_points_quantiles(matchday, seasons)
+    fig = go.Figure()
+    for season, q in zip(quantiles["season"], quantiles["q"]):
+        lowerfence, q1, median, q3, upperfence = q
+        fig.add_trace(go.Box(
+            name=season,
+            q1=[q1], median=[median], q3=[q3],
+            lowerfence=[lowerfence], upperfence=[upperfence],
+        ))
+    fig.update_layout(
+        **BASE_LAYOUT,
+        title=f"Points distribution at matchday {matchday}",
+        yaxis_title="Points",
+        showlegend=False,
+        xaxis_tickangle=45,
+    )
+    return fig.to_json()
+
+
+@st.cache_data(ttl=None)
+def build_race_json(season, top_n, matchday):
+    """Build the top-N points race as serialized figure JSON."""
+    import plotly.graph_objects as go
+
+    top_teams, race_wide = load_race_data(season, top_n, matchday)
+    if not top_teams:
+        return None
+
+    fig = go.Figure()
+    matchdays = race_wide.index.to_numpy()
+    for team in top_teams:
+        fig.add_trace(go.Scattergl(
+            x=matchdays,
+            y=race_wide[team].to_numpy(),
+            mode="lines",
+            name=team,
+        ))
+    fig.add_vline(x=matchday, line_dash="dash", line_color="red")
+    fig.update_layout(
+        **BASE_LAYOUT,
+        title=f"Points race — top {top_n} of {season} at matchday {matchday}",
+        xaxis_title="Matchday",
+        yaxis_title="Points",
+        hovermode="x unified",
+    )
+    return fig.to_json()
+
+
+# ===============================================================
+# Tab fragments
+# ===============================================================
+# Each tab renders inside its own fragment, so interacting with the
+# widgets of one tab (team picker, race controls) reruns only that tab
+# instead of the whole page.
+@st.cache_data(ttl=None)
+def get_top10(matchday, seasons_key):
+    """Return the pivoted top-10 comparison table for one selection.
+
+    Cached on (matchday, seasons) so fragment reruns reuse the shaped
+    table instead of redoing the sort/groupby/pivot.
+    """
+    # The slice arrives sorted by position from the SQL, so one groupby
+    # head suffices.
+    top10 = (
+        load_standings_slice(matchday, seasons_key)
+        .groupby("season", observed=True, sort=False)
+        .head(10)
+    )
+    pivot = top10.pivot(index="position", columns="season",
+                        values=["team", "points", "goal_diff"])
+    pivot = pivot.swaplevel(axis=1).reindex(
+        columns=pd.MultiIndex.from_product([seasons_key, ["team", "points", "goal_diff"]]),
+    )
+    pivot.columns = pd.MultiIndex.from_product([seasons_key, ["Team", "Pts", "GD"]])
+    pivot.index.name = "Pos"
+    return pivot
+
+
+@st.fragment
+def render_comparison_tab(filtered_standings, matchday, seasons_key):
+    st.markdown(f"### Top 10 at matchday {matchday}")
+    # One pivoted frame with season-grouped columns renders in a single
+    # Streamlit payload instead of one st.dataframe roundtrip per season.
+    st.dataframe(get_top10(matchday, seasons_key), height=400)
+
+    st.markdown("### 📦 Points Distribution")
+    st.plotly_chart(json.loads(build_points_box_json(matchday, seasons_key)),
+                    use_container_width=True, theme=None)
+
+    st.markdown("### 📋 Summary Statistics")
+    stats = summary_stats(matchday, seasons_key)
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Avg Leader Points", f"{stats['avg_leader_pts']:.1f}")
+    c2.metric("Avg Top 4 Points", f"{stats['avg_top4_pts']:.1f}")
+    c3.metric("Highest Points", stats["max_pts"])
+    c4.metric("Unique Teams", stats["total_teams"])
+
+
+@st.fragment
+def render_team_tracker_tab(filtered_standings, matchday, seasons_key):
+    # The slice's category index already holds the sorted unique teams,
+    # so the picker options cost O(#teams) with no extra query or scan.
+    available_teams = filtered_standings["team"].cat.categories
+    selected_team = st.selectbox("Team to track", available_teams)
+
+    # cache_data hands back a fresh copy, so annotating it is safe.
+    fig = build_team_trajectory_fig(selected_team, seasons_key)
+    fig.add_vline(x=matchday, line_dash="dash", line_color="red")
+    st.plotly_chart(fig, use_container_width=True, theme=None)
+
+    st.markdown(f"### {selected_team} at matchday {matchday}")
+    # One team filter + reindex gives a row per selected season (NaN
+    # where the team was out of Serie A); itertuples then walks the
+    # columns without any per-season lookups or scans.
+    team_wide = filtered_standings[
+        filtered_standings["team"] == selected_team
+    ].set_index("season").reindex(seasons_key)
+    stat_cols = st.columns(len(seasons_key))
+    for col, row in zip(stat_cols, team_wide.itertuples()):
+        with col:
+            if pd.isna(row.position):
+                st.caption(f"{row.Index}: not in Serie A")
+                continue
+            st.metric(row.Index, f"{row.position:.0f}°")
+            st.caption(f"{row.points:.0f} pts, GD {row.goal_diff:.0f}")
+
+
+@st.fragment
+def render_race_tab(seasons_key, matchday):
+    race_season = st.selectbox("Season", seasons_key, key="race_season")
+    top_n = st.slider("Number of top teams", 3, 10, 5)
+    race_json = build_race_json(race_season, top_n, matchday)
+    if race_json is None:
+        st.warning(f"No standings data for {race_season} at matchday {matchday}.")
+        return
+    st.plotly_chart(json.loads(race_json), use_container_width=True, theme=None)
+
+
+# ===============================================================
+# Page body
+# ===============================================================
+def show_standings_app():
+    if st.button("← Back to Home"):
+        st.session_state.app_selection = None
+
+    st.title("🏆 Serie A Standings")
+
+    available_seasons = get_available_seasons()
+    max_matchday = get_max_matchday()
+
+    st.subheader("⚙️ Comparison Settings")
+    matchday = st.slider("Matchday", 1, max_matchday, max_matchday)
+    selected_seasons = st.multiselect(
+        "Seasons to compare",
+        available_seasons,
+        default=available_seasons[-5:],
+    )
+
+    if not selected_seasons:
+        st.warning("Select at least one season to compare.")
+        return
+
+    seasons_key = tuple(sorted(selected_seasons))
+    filtered_standings = load_standings_slice(matchday, seasons_key)
+    if filtered_standings.empty:
+        st.warning("No standings data found for this selection.")
+        return
+
+    # st.tabs executes every tab body on each rerun even though only one
+    # is visible; a radio dispatch builds just the selected view.
+    view = st.radio(
+        "View",
+        ["📊 Season Comparison", "📈 Team Tracker", "🏁 Top Teams Evolution"],
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+
+    if view == "📊 Season Comparison":
+        render_comparison_tab(filtered_standings, matchday, seasons_key)
+    elif view == "📈 Team Tracker":
+        render_team_tracker_tab(filtered_standings, matchday, seasons_key)
+    else:
+        render_race_tab(seasons_key, matchday)
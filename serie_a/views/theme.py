@@ -0,0 +1,9 @@
+"""
+Shared Plotly layout defaults for all dashboard figures.
+"""
+
+# Frozen once at import; every builder splats this instead of
+# rebuilding the same layout dict per figure. Charts are rendered with
+# theme=None so Streamlit doesn't re-walk the figure to apply its own
+# theme on top.
+BASE_LAYOUT = dict(template="plotly_white", height=500)